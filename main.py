@@ -7,8 +7,9 @@ import sys
 
 
 def build_level(level_index):
-    """Return walls list, start_pos, exit_rect for a level index.
+    """Return walls list, start_pos, exit_rect, grid, theme and spawn_cells for a level index.
     Use a recursive backtracker to produce a perfect maze (guaranteed path).
+    spawn_cells lists the open (x, y) cells enemies may spawn in, outside the start and exit zones.
     """
     # compute grid size in cells (one grid cell == settings.CELL_SIZE pixels)
     cols = settings.WIDTH // settings.CELL_SIZE
@@ -99,11 +100,26 @@ def build_level(level_index):
                 rect = pygame.Rect(x * settings.CELL_SIZE, y * settings.CELL_SIZE, settings.CELL_SIZE, settings.CELL_SIZE)
                 walls.append(rect)
 
+    # Index of open cells enemies may spawn in, with the start and exit zones already excluded
+    start_zone = pygame.Rect(start_pos[0] - 3 * settings.CELL_SIZE, start_pos[1] - 3 * settings.CELL_SIZE, 6 * settings.CELL_SIZE, 6 * settings.CELL_SIZE)
+    exit_zone = exit_rect.inflate(3 * settings.CELL_SIZE, 3 * settings.CELL_SIZE)
+    spawn_cells = []
+    for y in range(1, rows - 1):
+        for x in range(1, cols - 1):
+            if grid[y][x] == 1:
+                continue
+            cx = x * settings.CELL_SIZE + settings.CELL_SIZE // 2
+            cy = y * settings.CELL_SIZE + settings.CELL_SIZE // 2
+            rect = pygame.Rect(cx - settings.TANK_SIZE // 2, cy - settings.TANK_SIZE // 2, settings.TANK_SIZE, settings.TANK_SIZE)
+            if rect.colliderect(start_zone) or rect.colliderect(exit_zone):
+                continue
+            spawn_cells.append((x, y))
+
     # Get theme for this level (use first theme for level 1, etc.; clamp if out of range)
     theme_idx = min(lvl0, len(settings.LEVEL_THEMES) - 1)
     theme = settings.LEVEL_THEMES[theme_idx]
 
-    return walls, start_pos, exit_rect, grid, theme
+    return walls, start_pos, exit_rect, grid, theme, spawn_cells
 
 
 def cell_from_pos(grid, px, py):
@@ -200,28 +216,68 @@ def update_bullets(bullets, walls, enemies, player, start_pos, is_enemy=False):
                     break
 
 
-def spawn_enemies(count, walls, start_pos, exit_rect):
+def spawn_enemies(count, pool, blocked=()):
+    """Spawn up to count enemies on cells drawn from pool (a working copy of a level's spawn_cells).
+    Cells are taken without replacement (swap-and-pop, O(1) per enemy), so one draw never puts two
+    tanks on the same cell. Cells in blocked are skipped and put back into the pool afterwards.
+    Returns fewer than count enemies if the pool runs dry; the caller decides whether to defer the rest.
+    """
     enemies = []
-    cols = settings.WIDTH // settings.CELL_SIZE
-    rows = settings.HEIGHT // settings.CELL_SIZE
-    attempts = 0
-    while len(enemies) < count and attempts < 500:
-        attempts += 1
-        cx = random.randint(1, cols - 2)
-        cy = random.randint(1, rows - 2)
-        pos = (cx * settings.CELL_SIZE + settings.CELL_SIZE // 2, cy * settings.CELL_SIZE + settings.CELL_SIZE // 2)
-        rect = pygame.Rect(pos[0] - settings.TANK_SIZE // 2, pos[1] - settings.TANK_SIZE // 2, settings.TANK_SIZE, settings.TANK_SIZE)
-        # don't spawn inside walls or too close to start/exit
-        if any(rect.colliderect(w) for w in walls):
-            continue
-        if rect.colliderect(pygame.Rect(start_pos[0] - 3 * settings.CELL_SIZE, start_pos[1] - 3 * settings.CELL_SIZE, 6 * settings.CELL_SIZE, 6 * settings.CELL_SIZE)):
-            continue
-        if rect.colliderect(exit_rect.inflate(3 * settings.CELL_SIZE, 3 * settings.CELL_SIZE)):
+    skipped = []
+    while len(enemies) < count and pool:
+        i = random.randrange(len(pool))
+        pool[i], pool[-1] = pool[-1], pool[i]
+        cell = pool.pop()
+        if cell in blocked:
+            skipped.append(cell)
             continue
+        pos = (cell[0] * settings.CELL_SIZE + settings.CELL_SIZE // 2, cell[1] * settings.CELL_SIZE + settings.CELL_SIZE // 2)
         enemies.append(tank.EnemyTank(pos[0], pos[1]))
+    pool.extend(skipped)
     return enemies
 
 
+def spawn_blocked_cells(grid, player, enemies):
+    """Return the cells a mid-level wave must not use: near the player or under a live enemy."""
+    px, py = cell_from_pos(grid, player.x, player.y)
+    r = settings.SPAWN_EXCLUSION_RADIUS
+    blocked = {(px + dx, py + dy) for dx in range(-r, r + 1) for dy in range(-r, r + 1)}
+    for e in enemies:
+        blocked.add(cell_from_pos(grid, e.x, e.y))
+    return blocked
+
+
+def stagger_path_timers(enemies, recompute_every):
+    """Delay each new wave enemy's first path search by a random number of frames,
+    so a large wave doesn't run all its A* searches on the same frame.
+    """
+    for e in enemies:
+        e._path_delay = random.randrange(recompute_every)
+
+
+def step_reinforcements(pending, backoff, pool, spawn_cells, grid, player, enemies, recompute_every):
+    """Spawn up to REINFORCEMENTS_PER_FRAME queued reinforcements for this frame.
+    Returns (wave, pending, backoff). Tanks that can't be placed stay pending until cells free up.
+    The pool is refilled from spawn_cells only once it is empty. If every remaining pool cell is
+    blocked, its leftovers are dropped (so the next try refills) and spawning backs off for
+    REINFORCEMENT_BACKOFF frames instead of rescanning every frame.
+    """
+    if pending <= 0:
+        return [], 0, 0
+    if backoff > 0:
+        return [], pending, backoff - 1
+    if not pool:
+        pool.extend(spawn_cells)
+    n = min(pending, settings.REINFORCEMENTS_PER_FRAME)
+    wave = spawn_enemies(n, pool, spawn_blocked_cells(grid, player, enemies))
+    stagger_path_timers(wave, recompute_every)
+    pending -= len(wave)
+    if len(wave) < n and pool:
+        pool.clear()
+        backoff = settings.REINFORCEMENT_BACKOFF
+    return wave, pending, backoff
+
+
 def main():
     pygame.init()
     screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
@@ -232,12 +288,17 @@ def main():
     lives = settings.PLAYER_LIVES
     won = False
 
-    walls, start_pos, exit_rect, grid, theme = build_level(level)
+    walls, start_pos, exit_rect, grid, theme, spawn_cells = build_level(level)
     bg_color, wall_color, exit_color = theme
     player = tank.Tank(start_pos[0], start_pos[1], (0, 200, 0))
     player_bullets = []
     enemy_bullets = []
-    enemies = spawn_enemies(settings.ENEMY_BASE_COUNT + level, walls, start_pos, exit_rect)
+    recompute_every = max(20 - level * 2, 8)
+    spawn_pool = list(spawn_cells)
+    enemies = spawn_enemies(settings.ENEMY_BASE_COUNT + level, spawn_pool)
+    wave_timer = settings.REINFORCEMENT_INTERVAL * settings.FPS
+    pending_spawns = 0
+    spawn_backoff = 0
 
     font = pygame.font.Font(None, 28)
 
@@ -258,22 +319,27 @@ def main():
         if not game_over:
             player.update(keys, walls)
 
+            # mid-level reinforcement waves: queue the whole wave, then spawn a few tanks per frame
+            if settings.REINFORCEMENT_COUNT > 0:
+                wave_timer -= 1
+                if wave_timer <= 0:
+                    pending_spawns += settings.REINFORCEMENT_COUNT
+                    wave_timer = settings.REINFORCEMENT_INTERVAL * settings.FPS
+            wave, pending_spawns, spawn_backoff = step_reinforcements(
+                pending_spawns, spawn_backoff, spawn_pool, spawn_cells, grid, player, enemies, recompute_every)
+            enemies.extend(wave)
+
             # enemies update
 
             # compute player cell once
             player_cell = cell_from_pos(grid, player.x, player.y)
 
             for e in enemies[:]:
-                # recompute path every so often or if empty
-                if not hasattr(e, 'path') or e.path is None:
-                    e.path = None
-                    e._path_timer = 0
-                if not hasattr(e, '_path_timer'):
-                    e._path_timer = 0
-
-                # recompute path every N frames (lower for easier levels)
-                recompute_every = max(20 - level * 2, 8)
-                if e._path_timer <= 0 or not e.path:
+                # wave enemies wait out a staggered delay before their first path search
+                if e._path_delay > 0:
+                    e._path_delay -= 1
+                # recompute path every N frames (lower for easier levels) or if empty
+                elif e._path_timer <= 0 or not e.path:
                     start_cell = cell_from_pos(grid, e.x, e.y)
                     p = astar(grid, start_cell, player_cell)
                     e.path = p
@@ -312,11 +378,16 @@ def main():
                     game_over = True
                 else:
                     level += 1
-                    walls, start_pos, exit_rect, grid, theme = build_level(level)
+                    walls, start_pos, exit_rect, grid, theme, spawn_cells = build_level(level)
                     bg_color, wall_color, exit_color = theme
                     player.x, player.y = start_pos
                     player.angle = 0
-                    enemies = spawn_enemies(settings.ENEMY_BASE_COUNT + level, walls, start_pos, exit_rect)
+                    recompute_every = max(20 - level * 2, 8)
+                    spawn_pool = list(spawn_cells)
+                    enemies = spawn_enemies(settings.ENEMY_BASE_COUNT + level, spawn_pool)
+                    wave_timer = settings.REINFORCEMENT_INTERVAL * settings.FPS
+                    pending_spawns = 0
+                    spawn_backoff = 0
                     player_bullets = []
                     enemy_bullets = []
 
@@ -341,7 +412,10 @@ def main():
             b.draw(screen)
 
         # HUD
-        hud = font.render(f"Level: {level}  Lives: {lives}  Enemies: {len(enemies)}", True, (220, 220, 220))
+        hud_text = f"Level: {level}  Lives: {lives}  Enemies: {len(enemies)}"
+        if pending_spawns > 0:
+            hud_text += f"  Incoming: {pending_spawns}"
+        hud = font.render(hud_text, True, (220, 220, 220))
         screen.blit(hud, (10, 10))
 
         if game_over:
@@ -18,6 +18,11 @@ ENEMY_SPEED = 2.0
 ENEMY_ROTATION_SPEED = 2.5
 ENEMY_FIRE_COOLDOWN = 90  # frames
 ENEMY_BASE_COUNT = 1
+REINFORCEMENT_INTERVAL = 20  # seconds between mid-level reinforcement waves
+REINFORCEMENT_COUNT = 0  # enemies per wave (0 disables waves)
+REINFORCEMENTS_PER_FRAME = 8  # wave tanks spawned per frame, so big waves spread over several frames
+SPAWN_EXCLUSION_RADIUS = 3  # cells around the player that mid-level waves avoid
+REINFORCEMENT_BACKOFF = 15  # frames to wait before retrying when every free spawn cell is blocked
 
 # Gameplay
 PLAYER_LIVES = 3
@@ -178,6 +178,10 @@ class EnemyTank(Tank):
     def __init__(self, x, y, color=(200, 30, 30)):
         super().__init__(x, y, color)
         self.fire_cooldown = random.randint(0, settings.ENEMY_FIRE_COOLDOWN)
+        # pathing state driven by the main loop (path waypoints, frames until recompute, initial delay)
+        self.path = None
+        self._path_timer = 0
+        self._path_delay = 0
 
     def update_ai(self, target, walls, path=None):
         """Update AI. If a path is provided (list of (x,y) pixel centers), follow it.
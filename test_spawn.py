@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+import main
+import settings
+import tank
+
+
+def test_spawn_cells_are_open_and_outside_start_and_exit_zones():
+    random.seed(1)
+    for level in range(1, settings.MAX_LEVELS + 1):
+        walls, start_pos, exit_rect, grid, theme, spawn_cells = main.build_level(level)
+        assert spawn_cells
+        start_zone = pygame.Rect(start_pos[0] - 3 * settings.CELL_SIZE, start_pos[1] - 3 * settings.CELL_SIZE, 6 * settings.CELL_SIZE, 6 * settings.CELL_SIZE)
+        exit_zone = exit_rect.inflate(3 * settings.CELL_SIZE, 3 * settings.CELL_SIZE)
+        for x, y in spawn_cells:
+            assert grid[y][x] == 0
+            cx = x * settings.CELL_SIZE + settings.CELL_SIZE // 2
+            cy = y * settings.CELL_SIZE + settings.CELL_SIZE // 2
+            rect = pygame.Rect(cx - settings.TANK_SIZE // 2, cy - settings.TANK_SIZE // 2, settings.TANK_SIZE, settings.TANK_SIZE)
+            assert not rect.colliderect(start_zone)
+            assert not rect.colliderect(exit_zone)
+            assert not any(rect.colliderect(w) for w in walls)
+
+
+def test_spawn_enemies_meets_count_on_distinct_cells():
+    random.seed(2)
+    cells = [(x, y) for y in range(1, 10) for x in range(1, 10)]
+    pool = list(cells)
+    enemies = main.spawn_enemies(50, pool)
+    assert len(enemies) == 50
+    assert len({(e.x, e.y) for e in enemies}) == 50
+    assert len(pool) == len(cells) - 50
+
+
+def test_spawn_enemies_stops_when_pool_runs_dry():
+    random.seed(3)
+    pool = [(1, 1), (3, 1), (5, 1)]
+    enemies = main.spawn_enemies(10, pool)
+    assert len(enemies) == 3
+    assert pool == []
+
+
+def test_spawn_enemies_skips_blocked_cells_and_returns_them_to_pool():
+    random.seed(4)
+    cells = [(x, 1) for x in range(1, 11)]
+    blocked = {(1, 1), (2, 1), (3, 1)}
+    pool = list(cells)
+    enemies = main.spawn_enemies(len(cells), pool, blocked)
+    assert len(enemies) == len(cells) - len(blocked)
+    used = {main.cell_from_pos([[0] * 12] * 3, e.x, e.y) for e in enemies}
+    assert not used & blocked
+    assert sorted(pool) == sorted(blocked)
+
+
+def _open_grid(cols, rows):
+    return [[0] * cols for _ in range(rows)]
+
+
+def test_spawn_blocked_cells_covers_player_radius_and_live_enemies():
+    grid = _open_grid(20, 20)
+    r = settings.SPAWN_EXCLUSION_RADIUS
+    player = tank.Tank(10 * settings.CELL_SIZE + 5, 10 * settings.CELL_SIZE + 5, (0, 200, 0))
+    enemy = tank.EnemyTank(18 * settings.CELL_SIZE + 5, 2 * settings.CELL_SIZE + 5)
+    blocked = main.spawn_blocked_cells(grid, player, [enemy])
+    assert (10 - r, 10 - r) in blocked
+    assert (10 + r, 10 + r) in blocked
+    assert (10 + r + 1, 10) not in blocked
+    assert (18, 2) in blocked
+
+
+def test_stagger_path_timers_spreads_first_search():
+    random.seed(5)
+    enemies = [tank.EnemyTank(0, 0) for _ in range(100)]
+    main.stagger_path_timers(enemies, 12)
+    delays = {e._path_delay for e in enemies}
+    assert all(0 <= d < 12 for d in delays)
+    assert len(delays) > 1
+
+
+def test_step_reinforcements_delivers_wave_larger_than_free_cells():
+    random.seed(6)
+    grid = _open_grid(30, 20)
+    spawn_cells = [(x, y) for y in range(1, 19) for x in range(1, 29)]
+    player = tank.Tank(2 * settings.CELL_SIZE + 15, 2 * settings.CELL_SIZE + 15, (0, 200, 0))
+    pending = len(spawn_cells) + 200
+    backoff = 0
+    pool = list(spawn_cells)
+    enemies = []
+    delivered = 0
+    r = settings.SPAWN_EXCLUSION_RADIUS
+    for frame in range(5000):
+        if pending == 0:
+            break
+        wave, pending, backoff = main.step_reinforcements(pending, backoff, pool, spawn_cells, grid, player, enemies, 12)
+        for e in wave:
+            cx, cy = main.cell_from_pos(grid, e.x, e.y)
+            assert max(abs(cx - 2), abs(cy - 2)) > r
+        assert len(wave) <= settings.REINFORCEMENTS_PER_FRAME
+        enemies.extend(wave)
+        delivered += len(wave)
+        # the player destroys a few tanks every frame, freeing their cells
+        del enemies[:3]
+    assert pending == 0
+    assert delivered == len(spawn_cells) + 200
+
+
+def test_step_reinforcements_backs_off_when_every_cell_is_blocked():
+    random.seed(7)
+    grid = _open_grid(10, 10)
+    spawn_cells = [(x, y) for y in range(1, 4) for x in range(1, 4)]
+    player = tank.Tank(2 * settings.CELL_SIZE + 15, 2 * settings.CELL_SIZE + 15, (0, 200, 0))
+    pool = list(spawn_cells)
+    wave, pending, backoff = main.step_reinforcements(5, 0, pool, spawn_cells, grid, player, [], 12)
+    assert wave == []
+    assert pending == 5
+    assert backoff == settings.REINFORCEMENT_BACKOFF
+    wave, pending, backoff = main.step_reinforcements(pending, backoff, pool, spawn_cells, grid, player, [], 12)
+    assert wave == []
+    assert backoff == settings.REINFORCEMENT_BACKOFF - 1